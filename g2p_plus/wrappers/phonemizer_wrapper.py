@@ -10,11 +10,13 @@ options for fine-tuning the transcription process.
 """
 
 import logging
+import multiprocessing
 import os
 import re
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
-from phonemizer import phonemize
 from phonemizer.separator import Separator
 from phonemizer.backend import EspeakBackend, SegmentsBackend
 
@@ -22,10 +24,20 @@ from g2p_plus.wrappers.wrapper import Wrapper
 
 SECONDARY_STRESS = 'ˈ'  # Secondary stress marker used by espeak-ng
 PRIMARY_STRESS = "'"    # Primary stress marker used by espeak-ng
+PHONE_SEPARATOR = '\x1f' # ASCII unit separator, never produced by the backends
+SMALL_BATCH_SIZE = 32   # Batches smaller than this are transcribed line by line through the line caches
+MIN_LINES_PER_JOB = 1000 # Fewest lines per worker process, so espeak compute outweighs pool startup
+SEGMENTS_CHUNK_SIZE = 256 # Japanese lines sent to the segments backend per call
+VOICES_PATTERN = re.compile(r'^\s*\S+\s+(\S+)', re.M) # Language column of `espeak-ng --voices`
 
 @lru_cache(maxsize=8)
 def get_espeak_backend(language, preserve_punctuation, with_stress, words_mismatch):
     """Creates and caches an EspeakBackend instance.
+
+    The backend loads libespeak-ng in-process once and is reused for every
+    call, so there is no per-call initialization cost. It is preferred over
+    piping text through the espeak-ng executable, which splits utterances at
+    punctuation and would lose language switch and word mismatch handling.
         
     Returns:
         EspeakBackend: Configured backend instance
@@ -46,6 +58,104 @@ def get_segments_backend(preserve_punctuation):
     """
     return SegmentsBackend('japanese', preserve_punctuation=preserve_punctuation)
 
+_worker_backend = None  # EspeakBackend owned by an espeak worker process
+
+def init_espeak_worker(language, preserve_punctuation, with_stress, words_mismatch):
+    """Gets the EspeakBackend used by an espeak worker process.
+
+    Runs once per worker, so espeak-ng is only initialized once per process
+    rather than once per chunk. The parent builds the backend before forking,
+    so a forked worker always reuses the one inherited from the parent's cache.
+    Forked workers exit without running finalizers, so a backend built here
+    would leave its temporary copy of libespeak-ng behind. The cache must not
+    be cleared either: dropping the inherited backend would run its finalizer,
+    which deletes the parent's copy. A spawned worker builds its own backend
+    and cleans it up when the worker's interpreter exits.
+    """
+    global _worker_backend
+    # Spawned workers do not inherit the filter added by PhonemizerWrapper.__init__
+    logging.getLogger('phonemizer').addFilter(drop_phonemizer_warnings)
+    _worker_backend = get_espeak_backend(language, preserve_punctuation, with_stress, words_mismatch)
+
+def transcribe_espeak_chunk(lines, separator, strip):
+    """Transcribes a chunk of lines using the worker's EspeakBackend.
+
+    Returns:
+        list[str]: Transcribed lines
+    """
+    return _worker_backend.phonemize(lines, separator=separator, strip=strip)
+
+@lru_cache(maxsize=1)
+def get_espeak_voices():
+    """Lists and caches the language codes of the installed espeak-ng voices.
+
+    Returns:
+        frozenset[str]: Supported language codes
+
+    Raises:
+        subprocess.CalledProcessError: If `espeak-ng --voices` fails
+    """
+    output = subprocess.run(['espeak-ng', '--voices'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
+    # The first match is the "Language" column header
+    return frozenset(VOICES_PATTERN.findall(output)[1:])
+
+@lru_cache(maxsize=100_000)
+def transcribe_espeak_line(line, language, preserve_punctuation, with_stress, words_mismatch, phone_separator, word_separator, strip):
+    """Transcribes and caches a single line using the espeak backend.
+
+    Repeated utterances are common in conversational corpora, so caching
+    per line avoids sending the same text to espeak-ng more than once.
+
+    Returns:
+        str: Transcribed line
+    """
+    backend = get_espeak_backend(language, preserve_punctuation, with_stress, words_mismatch)
+    return backend.phonemize(
+        [line],
+        separator=Separator(phone=phone_separator, word=word_separator, syllable=''),
+        strip=strip)[0]
+
+@lru_cache(maxsize=100_000)
+def transcribe_segments_line(line, preserve_punctuation, phone_separator, word_separator, strip):
+    """Transcribes and caches a single Japanese line using the segments backend.
+
+    Returns:
+        str: Transcribed line
+
+    Raises:
+        ValueError: If the line contains graphemes missing from the segments file
+    """
+    backend = get_segments_backend(preserve_punctuation)
+    return backend.phonemize(
+        [line],
+        separator=Separator(phone=phone_separator, word=word_separator, syllable=''),
+        strip=strip)[0]
+
+def drop_phonemizer_warnings(record):
+    """Logging filter that keeps only records above WARNING level.
+
+    Returns:
+        bool: True if the record should be logged
+    """
+    return record.levelno > logging.WARNING
+
+def dedup_dispatch(lines, transcribe_fn):
+    """Transcribes each distinct line once and scatters the results back.
+
+    Args:
+        lines (list[str]): Text strings to transcribe, possibly with repeats
+        transcribe_fn (callable): Function mapping a list of lines to a list
+            of transcriptions of the same length
+
+    Returns:
+        list[str]: Transcriptions in the same order as `lines`
+    """
+    unique_lines = list(dict.fromkeys(lines))
+    if len(unique_lines) == len(lines):
+        return transcribe_fn(lines)
+    transcribed = dict(zip(unique_lines, transcribe_fn(unique_lines)))
+    return [transcribed[line] for line in lines]
+
 class PhonemizerWrapper(Wrapper):
     """
     Wrapper for the phonemizer library's text-to-phoneme conversion.
@@ -62,18 +172,21 @@ class PhonemizerWrapper(Wrapper):
 
     WRAPPER_KWARGS_TYPES = {
         'allow_possibly_faulty_word_boundaries': bool,
+        'njobs': int,
         'preserve_punctuation': bool,
         'with_stress': bool,
     }
 
     WRAPPER_KWARGS_DEFAULTS = {
         'allow_possibly_faulty_word_boundaries': False,
+        'njobs': 1,
         'preserve_punctuation': False,
         'with_stress': False,
     }
 
     KWARGS_HELP = {
         'allow_possibly_faulty_word_boundaries': 'Allow possibly faulty word boundaries (otherwise removes lines with mismatched word boundaries).',
+        'njobs': 'Number of worker processes used to transcribe large batches with espeak-ng.',
         'preserve_punctuation': 'Preserve punctuation in the transcribed output.',
         'with_stress': 'Include stress markers in the transcribed output.',
     }
@@ -99,15 +212,28 @@ class PhonemizerWrapper(Wrapper):
         In addition to the base Wrapper parameters, this sets up:
         - Separator configuration for phones, words, and syllables
         - Word boundary mismatch handling
-        - Multi-processing settings
+        - A post-processing method specialized for the word boundary setting
+        - Validation of the multi-processing settings
+        - Filtering of phonemizer warnings
         """
         super().__init__(language, keep_word_boundaries, verbose, uncorrected, **wrapper_kwargs)
-        self.separator = Separator(phone='PHONE_BOUNDARY', word=' ', syllable='')
+        if self.njobs < 1:
+            raise ValueError(f'Argument "njobs" must be at least 1. Got {self.njobs} instead.')
+        self.separator = Separator(phone=PHONE_SEPARATOR, word=' ', syllable='')
         self.strip = True
 
         # Configure word boundary mismatch handling
         self.words_mismatch = 'ignore' if self.allow_possibly_faulty_word_boundaries or not self.keep_word_boundaries else 'remove'
-        self.njobs = 4
+
+        # Choose the post-processing method once, rather than branching on every line
+        if self.keep_word_boundaries:
+            self._post_process_line = self._post_process_line_with_word_boundaries
+        else:
+            self._post_process_line = self._post_process_line_without_word_boundaries
+
+        # Silence phonemizer's warnings (e.g. about mismatched word counts) without
+        # touching global logging state. Adding the same filter twice is a no-op.
+        logging.getLogger('phonemizer').addFilter(drop_phonemizer_warnings)
 
     def check_language_support(self, language):
         """ 
@@ -124,32 +250,41 @@ class PhonemizerWrapper(Wrapper):
         """
         if language == 'ja':
             return True
-        if language in self.get_supported_languages():
-            return True
-        return False
+        return language in self._get_espeak_voices()
         
     def get_supported_languages(self):
         """ 
         Gets list of languages supported by espeak-ng backend.
 
+        The voice list is only read from espeak-ng once per process.
+
+        Returns:
+            list[str]: Sorted list of supported language codes, empty if espeak-ng
+                      is not installed
+        """
+        return sorted(self._get_espeak_voices())
+
+    def _get_espeak_voices(self):
+        """ 
+        Gets the cached set of languages supported by espeak-ng backend.
+
         Returns:
-            list[str]: List of supported language codes, empty if espeak-ng
+            frozenset[str]: Supported language codes, empty if espeak-ng
                       is not installed
         """
         try:
-            output = subprocess.run(['espeak-ng', '--voices'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
-            languages = [re.sub(r'\s+', ' ', l.strip()).split(' ')[1] for l in output.strip().split('\n')][1:]
-            return languages
+            return get_espeak_voices()
         except subprocess.CalledProcessError:
             self.logger.error('Phonemizer requires espeak-ng to be installed. Please install espeak-ng.')
-            return []
+            return frozenset()
         
     def _transcribe(self, lines):
         """ 
         Converts text to phonemes using the appropriate backend.
 
         Uses the segments backend for Japanese and espeak-ng for all other
-        languages. Failed conversions return empty strings.
+        languages. Blank lines are skipped and repeated lines are only sent to
+        the backend once. Failed conversions return empty strings.
 
         Args:
             lines (list[str]): Text strings to convert to phonemes
@@ -157,16 +292,26 @@ class PhonemizerWrapper(Wrapper):
         Returns:
             list[str]: Transcribed versions of input lines
         """
+        nonempty_indices = [i for i, line in enumerate(lines) if line.strip()]
+        nonempty_lines = [lines[i] for i in nonempty_indices]
         if self.language == 'ja':
-            transcribed_lines = self._transcribe_japanese(lines)
+            transcribed_nonempty = dedup_dispatch(nonempty_lines, self._transcribe_japanese)
         else:
-            transcribed_lines = self._transcribe_utterances(lines)
+            transcribed_nonempty = dedup_dispatch(nonempty_lines, self._transcribe_utterances)
+
+        transcribed_lines = [''] * len(lines)
+        for i, transcribed in zip(nonempty_indices, transcribed_nonempty):
+            transcribed_lines[i] = transcribed
         return transcribed_lines
 
     def _transcribe_japanese(self, lines):
         """ 
         Transcribes Japanese text using the segments backend.
 
+        Lines are transcribed in chunks of up to `SEGMENTS_CHUNK_SIZE`. If a chunk
+        contains a line the segments file cannot handle, that chunk falls back
+        to line-by-line transcription so only the faulty lines are lost.
+
         Args:
             lines (list[str]): Japanese text strings to transcribe
 
@@ -175,17 +320,28 @@ class PhonemizerWrapper(Wrapper):
         """
         self.logger.debug('Using the segments backend to transcribe Japanese text.')
         backend = get_segments_backend(self.preserve_punctuation)
-        phn = []
+        phn = [''] * len(lines)
         missed_lines = 0
-        for line in lines:
+        for start in range(0, len(lines), SEGMENTS_CHUNK_SIZE):
+            chunk = lines[start:start + SEGMENTS_CHUNK_SIZE]
             try:
-                phn.append(backend.phonemize(
-                    [line],
+                phn[start:start + len(chunk)] = backend.phonemize(
+                    chunk,
                     separator=self.separator,
-                    strip=self.strip)[0])
+                    strip=self.strip)
+                continue
             except ValueError:
-                missed_lines += 1
-                phn.append('')
+                pass
+            for i, line in enumerate(chunk, start):
+                try:
+                    phn[i] = transcribe_segments_line(
+                        line,
+                        self.preserve_punctuation,
+                        self.separator.phone,
+                        self.separator.word,
+                        self.strip)
+                except ValueError:
+                    missed_lines += 1
         if missed_lines > 0:
             self.logger.debug(f'{missed_lines} lines were not transcribed due to errors with the segments file.')
 
@@ -195,6 +351,15 @@ class PhonemizerWrapper(Wrapper):
         """ 
         Transcribes text using the espeak-ng backend.
 
+        Small batches are transcribed line by line so that repeated lines are
+        served from the line cache. Larger batches are split into contiguous
+        chunks and transcribed by up to `njobs` worker processes, each holding
+        its own espeak backend and given at least `MIN_LINES_PER_JOB` lines.
+
+        Punctuation is not stripped here: unless `preserve_punctuation` is set,
+        the backend already removes it with phonemizer's own rules (keeping
+        decimal separators) before any text reaches espeak-ng.
+
         Args:
             lines (list[str]): Text strings to transcribe
 
@@ -202,24 +367,70 @@ class PhonemizerWrapper(Wrapper):
             list[str]: Transcribed text strings
         """
         self.logger.debug(f'Using espeak backend with language code "{self.language}"...')
-        logging.disable(logging.WARNING)
-        backend = get_espeak_backend(self.language,
-                                     self.preserve_punctuation,
-                                     self.with_stress,
-                                     self.words_mismatch)
-        
-        phn = backend.phonemize(
-            lines,
-            separator=self.separator,
-            strip=self.strip)
+        if len(lines) < SMALL_BATCH_SIZE:
+            phn = [transcribe_espeak_line(line,
+                                          self.language,
+                                          self.preserve_punctuation,
+                                          self.with_stress,
+                                          self.words_mismatch,
+                                          self.separator.phone,
+                                          self.separator.word,
+                                          self.strip) for line in lines]
+        elif min(self.njobs, len(lines) // MIN_LINES_PER_JOB) <= 1:
+            backend = get_espeak_backend(self.language,
+                                         self.preserve_punctuation,
+                                         self.with_stress,
+                                         self.words_mismatch)
             
-        logging.disable(logging.NOTSET)
-        
+            phn = backend.phonemize(
+                lines,
+                separator=self.separator,
+                strip=self.strip)
+        else:
+            phn = self._transcribe_utterances_parallel(lines)
+
         return phn
 
-    def _post_process_line(self, line):
+    def _transcribe_utterances_parallel(self, lines):
+        """ 
+        Transcribes text using the espeak-ng backend across worker processes.
+
+        Args:
+            lines (list[str]): Text strings to transcribe
+
+        Returns:
+            list[str]: Transcribed text strings, in the same order as `lines`
+        """
+        njobs = min(self.njobs, len(lines) // MIN_LINES_PER_JOB)
+        chunk_size = -(-len(lines) // njobs)
+        chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        self.logger.debug(f'Transcribing {len(lines)} lines in {len(chunks)} chunks across {njobs} processes...')
+
+        # Forking avoids re-importing phonemizer in every worker, but is only safe on Linux
+        mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+        # Build the backend before forking, so forked workers inherit it instead of creating their own
+        get_espeak_backend(self.language,
+                           self.preserve_punctuation,
+                           self.with_stress,
+                           self.words_mismatch)
+        with ProcessPoolExecutor(max_workers=njobs,
+                                 mp_context=mp_context,
+                                 initializer=init_espeak_worker,
+                                 initargs=(self.language,
+                                           self.preserve_punctuation,
+                                           self.with_stress,
+                                           self.words_mismatch)) as executor:
+            results = executor.map(transcribe_espeak_chunk,
+                                   chunks,
+                                   [self.separator] * len(chunks),
+                                   [self.strip] * len(chunks))
+            return [line for chunk in results for line in chunk]
+
+    def _post_process_line_with_word_boundaries(self, line):
         """
-        Post-processes transcribed output to handle word boundaries and spacing.
+        Post-processes transcribed output, marking word boundaries.
+
+        Bound to `_post_process_line` when `keep_word_boundaries` is True.
 
         Args:
             line (str): Transcribed line to process
@@ -227,11 +438,19 @@ class PhonemizerWrapper(Wrapper):
         Returns:
             str: Processed line with proper word boundaries and spacing
         """
-        if self.keep_word_boundaries:
-            line = line.replace(' ', ' WORD_BOUNDARY ')
-        line = line.replace('PHONE_BOUNDARY', ' ')
-        line = super()._post_process_line(line)
-        if self.keep_word_boundaries:
-            line = line + ' WORD_BOUNDARY'
-        return line
+        line = line.replace(' ', ' WORD_BOUNDARY ').replace(PHONE_SEPARATOR, ' ')
+        return super()._post_process_line(line) + ' WORD_BOUNDARY'
+
+    def _post_process_line_without_word_boundaries(self, line):
+        """
+        Post-processes transcribed output, dropping word boundaries.
 
+        Bound to `_post_process_line` when `keep_word_boundaries` is False.
+
+        Args:
+            line (str): Transcribed line to process
+
+        Returns:
+            str: Processed line with proper spacing
+        """
+        return super()._post_process_line(line.replace(PHONE_SEPARATOR, ' '))
@@ -7,12 +7,30 @@ handles both numbered and unnumbered pinyin formats.
 """
 
 import re
+from functools import lru_cache
 
 from pinyin_to_ipa import pinyin_to_ipa
 from g2p_plus.wrappers.wrapper import Wrapper
 
 MANDARIN_TONES = ['˧', '˥']
 
+@lru_cache(maxsize=4096)
+def get_syllable_ipa(syllable):
+    """Converts and caches a single pinyin syllable to IPA.
+
+    Mandarin has only around 1,300 toned syllables, so the cache quickly
+    covers every syllable in a corpus. Invalid syllables are cached as None,
+    so pinyin_to_ipa only raises once for each distinct invalid syllable.
+
+    Returns:
+        tuple[str] or None: IPA phonemes for the most likely pronunciation of
+            the syllable, or None if it is not valid pinyin
+    """
+    try:
+        return pinyin_to_ipa(syllable)[0]
+    except Exception:
+        return None
+
 class Pinyin_To_IpaWrapper(Wrapper):
     """
     Wrapper for converting Mandarin pinyin to IPA phonemes.
@@ -28,6 +46,9 @@ class Pinyin_To_IpaWrapper(Wrapper):
 
     SUPPORTED_LANGUAGES = ['mandarin']
 
+    # Matches pinyin syllables in both numbered and unnumbered formats
+    SYLLABLE_PATTERN = re.compile(r'[a-zA-Z]+[0-9]*')
+
     WRAPPER_KWARGS_TYPES = {
         'split_tones': bool,
     }
@@ -55,9 +76,10 @@ class Pinyin_To_IpaWrapper(Wrapper):
         """ 
         Converts pinyin text to IPA phonemes.
 
-        The method splits each line into words, then processes each word's syllables
-        individually. It handles both numbered pinyin (e.g. "ni3") and unnumbered
-        pinyin text.
+        The method splits each line into words on runs of whitespace, then processes
+        each word's syllables individually. Repeated spaces therefore do not produce
+        empty words or repeated word boundaries. It handles both numbered pinyin
+        (e.g. "ni3") and unnumbered pinyin text.
 
         Args:
             lines (list[str]): List of pinyin text strings to convert
@@ -75,40 +97,42 @@ class Pinyin_To_IpaWrapper(Wrapper):
                 Input: "shu4ye4 li3mian4 dui4"
                 Output: "ʃ̺ u˥˩ j e˥˩ l i˧˩˧ m j ɛ˥˩ n t w ei˥˩"
         """
-        transcribed_utterances = []
+        transcribed_utterances = [''] * len(lines)
         broken = 0
-        for line in lines:
+        # Loop-invariant settings, looked up once rather than per word and syllable
+        keep_word_boundaries = self.keep_word_boundaries
+        split_tones = self.split_tones
+        for index, line in enumerate(lines):
             if line.strip() == '':
-                transcribed_utterances.append('')
                 continue
 
-            transcribed = ""
-            words = line.split(' ')
-            try:
-                for word in words:
-                    # Extract pinyin syllables, handling both numbered and unnumbered formats
-                    syllables = re.findall(r'[a-zA-Z]+[0-9]*', word)
-                    # Remove any '0' tone markers as they're not needed
-                    syllables = [re.sub(r'[0]', '', syllable) for syllable in syllables]
-                    
-                    for syllable in syllables:
-                        syll_set = pinyin_to_ipa(syllable)
-                        syll = ' '.join(syll_set[0])
-                        # Handle tone splitting (add a space before the first tone symbol found)
-                        if self.split_tones:
-                            for i in range(len(syll)):
-                                if syll[i] in MANDARIN_TONES:
-                                    syll = syll[:i] + ' ' + syll[i:]
-                                    break
-                        transcribed += syll + ' '
-                    
-                    if self.keep_word_boundaries:
-                        transcribed += 'WORD_BOUNDARY '
-            except Exception as e:
-                transcribed = ""
+            parts = []
+            words = line.split()
+            for word in words:
+                # Extract pinyin syllables, removing any '0' tone markers as they're not needed
+                syllables = [syllable.replace('0', '') for syllable in self.SYLLABLE_PATTERN.findall(word)]
+                syllables_ipa = [get_syllable_ipa(syllable) for syllable in syllables]
+                if None in syllables_ipa:
+                    parts = None
+                    break
+                
+                for syllable_ipa in syllables_ipa:
+                    syll = ' '.join(syllable_ipa)
+                    # Handle tone splitting (add a space before the first tone symbol found)
+                    if split_tones:
+                        for i in range(len(syll)):
+                            if syll[i] in MANDARIN_TONES:
+                                syll = syll[:i] + ' ' + syll[i:]
+                                break
+                    parts.append(syll)
+                
+                if keep_word_boundaries:
+                    parts.append('WORD_BOUNDARY')
+
+            if parts is None:
                 broken += 1
-
-            transcribed_utterances.append(transcribed)
+            elif parts:
+                transcribed_utterances[index] = ' '.join(parts) + ' '
 
         if broken > 0:
             self.logger.debug(f'WARNING: {broken} lines were not transcribed successfully by pinyin to ipa conversion.')